@@ -1,39 +1,19 @@
 import streamlit as st
 import pandas as pd
+import numpy as np
 import json
 from datetime import datetime, timedelta
 from pathlib import Path
 import plotly.graph_objects as go
 import plotly.express as px
 
-# Configure Streamlit page
-st.set_page_config(
-    page_title="SpikeTrade Performance",
-    page_icon="📈",
-    layout="wide",
-    initial_sidebar_state="expanded"
-)
-
-# Initialize session state for authentication
-if 'owner_authenticated' not in st.session_state:
-    st.session_state.owner_authenticated = False
-
-# Display logo and header
-col1, col2 = st.columns([1, 4])
-with col1:
-    try:
-        st.image("website/static/logo2.jpg", width=80)
-    except:
-        st.image("static/logo2.jpg", width=80)
-
-with col2:
-    st.title("SpikeTrade Performance")
-    st.markdown("*Real-time trading performance and historical trade analysis*")
-
-st.divider()
+try:
+    import orjson
+except ImportError:  # stdlib json fallback
+    orjson = None
 
 # Custom CSS for professional styling
-st.markdown("""
+CSS_BLOCK = """
 <style>
     .metric-card {
         background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
@@ -73,34 +53,116 @@ st.markdown("""
         margin: 8px 0;
     }
 </style>
-""", unsafe_allow_html=True)
+"""
+
+LOGO_PATHS = ("website/static/logo2.jpg", "static/logo2.jpg")
+
+# Configure Streamlit page
+st.set_page_config(
+    page_title="SpikeTrade Performance",
+    page_icon="📈",
+    layout="wide",
+    initial_sidebar_state="expanded"
+)
+
+# Initialize session state for authentication
+if 'owner_authenticated' not in st.session_state:
+    st.session_state.owner_authenticated = False
+
+@st.cache_resource
+def resolve_logo_path():
+    """Find the logo once per process instead of probing paths each rerun"""
+    return next((path for path in LOGO_PATHS if Path(path).exists()), None)
+
+# Display logo and header
+col1, col2 = st.columns([1, 4])
+with col1:
+    logo_path = resolve_logo_path()
+    if logo_path:
+        st.image(logo_path, width=80)
+
+with col2:
+    st.title("SpikeTrade Performance")
+    st.markdown("*Real-time trading performance and historical trade analysis*")
+
+st.divider()
+
+# Inject custom CSS
+st.markdown(CSS_BLOCK, unsafe_allow_html=True)
 
 # Data management
 DATA_DIR = Path("website/data")
 DATA_DIR.mkdir(exist_ok=True)
-TRADES_FILE = DATA_DIR / "trades.json"
+TRADES_FILE = DATA_DIR / "trades.jsonl"
+LEGACY_TRADES_FILE = DATA_DIR / "trades.json"
+
+def _trades_mtime():
+    """Modification time of the trades file, used as the cache key"""
+    return TRADES_FILE.stat().st_mtime if TRADES_FILE.exists() else 0.0
+
+@st.cache_data(ttl=5)
+def _load_trades_cached(mtime):
+    """Load trades from JSONL file, memoized per file modification time"""
+    if not TRADES_FILE.exists():
+        return []
+    loads = orjson.loads if orjson else json.loads
+    return [loads(line) for line in TRADES_FILE.read_bytes().splitlines() if line.strip()]
 
 def load_trades():
-    """Load trades from JSON file"""
-    if TRADES_FILE.exists():
-        with open(TRADES_FILE, 'r') as f:
-            return json.load(f)
-    return []
+    """Load trades from JSONL file"""
+    return _load_trades_cached(_trades_mtime())
+
+@st.cache_data(max_entries=8)
+def build_trades_df(mtime):
+    """Build the trades DataFrame with parsed timestamps"""
+    trades = _load_trades_cached(mtime)
+    if not trades:
+        return pd.DataFrame()
+    df = pd.DataFrame(trades)
+    df['entry_time'] = pd.to_datetime(df['entry_time'])
+    df['exit_time'] = pd.to_datetime(df['exit_time'])
+    for col in ('symbol', 'type', 'status'):
+        df[col] = df[col].astype('category')
+    # Prices and P&L stay float64; float32 rounds cents and drifts in cumsum
+    if 'id' in df:
+        df['id'] = pd.to_numeric(df['id'], downcast='integer')
+    return df
+
+def _dump_trade(trade):
+    """Serialize a trade as one JSONL record"""
+    if orjson:
+        return orjson.dumps(trade, option=orjson.OPT_SERIALIZE_NUMPY) + b"\n"
+    return (json.dumps(trade, default=str) + "\n").encode()
 
 def save_trades(trades):
-    """Save trades to JSON file"""
-    with open(TRADES_FILE, 'w') as f:
-        json.dump(trades, f, indent=2, default=str)
+    """Rewrite the JSONL file with the given trades (migration/compaction)"""
+    TRADES_FILE.write_bytes(b"".join(_dump_trade(trade) for trade in trades))
+
+def append_trade(trade):
+    """Append a single trade to the JSONL file"""
+    with open(TRADES_FILE, 'ab') as f:
+        f.write(_dump_trade(trade))
+
+def migrate_legacy_trades():
+    """Convert a trades.json array from older versions into trades.jsonl"""
+    if LEGACY_TRADES_FILE.exists() and not TRADES_FILE.exists():
+        with open(LEGACY_TRADES_FILE, 'r') as f:
+            save_trades(json.load(f))
+
+def _next_trade_id():
+    """Next trade id, past both the stored trades and this session's counter"""
+    stored_next = max((t.get('id') or 0 for t in load_trades()), default=0) + 1
+    trade_id = max(stored_next, st.session_state.get('_next_trade_id', 1))
+    st.session_state['_next_trade_id'] = trade_id + 1
+    return trade_id
 
 def add_trade(symbol, entry_price, exit_price, entry_time, exit_time, trade_type, status, notes=""):
     """Add a new trade"""
-    trades = load_trades()
-    
     pnl = (exit_price - entry_price) if exit_price else 0
     pnl_percent = (pnl / entry_price * 100) if entry_price else 0
     
     trade = {
-        "id": len(trades) + 1,
+        "id": _next_trade_id(),
         "symbol": symbol.upper(),
         "entry_price": float(entry_price),
         "exit_price": float(exit_price) if exit_price else None,
@@ -114,13 +176,14 @@ def add_trade(symbol, entry_price, exit_price, entry_time, exit_time, trade_type
         "recorded_at": datetime.now().isoformat()
     }
     
-    trades.append(trade)
-    save_trades(trades)
+    append_trade(trade)
+    _load_trades_cached.clear()
     return trade
 
-def get_performance_metrics(trades_df):
-    """Calculate performance metrics"""
-    if trades_df.empty:
+@st.cache_data(max_entries=8)
+def get_performance_metrics(pnl, status):
+    """Calculate performance metrics from the pnl and status columns"""
+    if pnl.size == 0:
         return {
             "total_trades": 0,
             "winning_trades": 0,
@@ -132,26 +195,38 @@ def get_performance_metrics(trades_df):
             "worst_trade": 0
         }
     
-    closed_trades = trades_df[trades_df['status'] == 'CLOSED']
+    pnl = pnl.astype(np.float64)
+    closed_mask = status == 'CLOSED'
+    closed_pnl = pnl[closed_mask] if closed_mask.any() else pnl
+    total = closed_pnl.size
     
-    if closed_trades.empty:
-        closed_trades = trades_df
-    
-    winning = (closed_trades['pnl'] > 0).sum()
-    losing = (closed_trades['pnl'] < 0).sum()
-    total = len(closed_trades)
+    # Skip trades without a pnl, as the pandas reductions did
+    closed_pnl = closed_pnl[~np.isnan(closed_pnl)]
+    winning = (closed_pnl > 0).sum()
+    losing = (closed_pnl < 0).sum()
+    has_pnl = closed_pnl.size > 0
     
     return {
-        "total_trades": len(trades_df),
+        "total_trades": pnl.size,
         "winning_trades": winning,
         "losing_trades": losing,
         "win_rate": (winning / total * 100) if total > 0 else 0,
-        "total_pnl": closed_trades['pnl'].sum(),
-        "avg_pnl": closed_trades['pnl'].mean(),
-        "best_trade": closed_trades['pnl'].max(),
-        "worst_trade": closed_trades['pnl'].min()
+        "total_pnl": closed_pnl.sum(),
+        "avg_pnl": closed_pnl.mean() if has_pnl else np.nan,
+        "best_trade": closed_pnl.max() if has_pnl else np.nan,
+        "worst_trade": closed_pnl.min() if has_pnl else np.nan
     }
 
+@st.cache_data(max_entries=8)
+def cumulative_pnl(entry_times, pnl):
+    """Entry times in chronological order with the running P&L total"""
+    order = np.argsort(entry_times, kind='stable')
+    pnl = pnl[order].astype(np.float64)
+    # Trades without a pnl are skipped, as with Series.cumsum
+    cum_pnl = np.nancumsum(pnl)
+    cum_pnl[np.isnan(pnl)] = np.nan
+    return entry_times[order], cum_pnl
+
 # Sidebar - Owner login
 st.sidebar.markdown("---")
 st.sidebar.markdown("### 🔒 Owner Access")
@@ -181,83 +256,146 @@ st.sidebar.markdown("---")
 page = st.sidebar.radio("Navigation", ["Dashboard", "Trade History", "Add Trade", "Analytics"])
 
 # Load trades
-trades_data = load_trades()
-trades_df = pd.DataFrame(trades_data) if trades_data else pd.DataFrame()
+migrate_legacy_trades()
+trades_mtime = _trades_mtime()
+trades_data = _load_trades_cached(trades_mtime)
+trades_df = build_trades_df(trades_mtime)
+
+# Page fragments - widget interactions inside these rerun only the fragment
+@st.fragment(run_every=30)
+def render_dashboard():
+    """Performance summary and live trade ticker, refreshed from disk every 30 seconds"""
+    trades_df = build_trades_df(_trades_mtime())
+    if trades_df.empty:
+        return
+    metrics = get_performance_metrics(trades_df['pnl'].to_numpy(), trades_df['status'].to_numpy(dtype=str))
+
+    col1, col2, col3, col4 = st.columns(4)
+
+    with col1:
+        st.metric("Total Trades", int(metrics['total_trades']), 
+                 delta=f"{metrics['win_rate']:.1f}% Win Rate")
+
+    with col2:
+        color = "🟢" if metrics['winning_trades'] > metrics['losing_trades'] else "🔴"
+        st.metric(f"{color} Winning / Losing", 
+                 f"{int(metrics['winning_trades'])} / {int(metrics['losing_trades'])}")
 
-if not trades_df.empty:
-    trades_df['entry_time'] = pd.to_datetime(trades_df['entry_time'])
-    trades_df['exit_time'] = pd.to_datetime(trades_df['exit_time'])
+    with col3:
+        pnl_color = "green" if metrics['total_pnl'] > 0 else "red"
+        st.metric("Total P&L", f"${metrics['total_pnl']:.2f}", 
+                 delta_color=pnl_color if metrics['total_pnl'] > 0 else "red")
+
+    with col4:
+        st.metric("Avg P&L per Trade", f"${metrics['avg_pnl']:.2f}")
+
+    # Recent trades - Live Ticker Style
+    st.subheader("📺 Live Trade Ticker")
+    recent = trades_df.tail(15).sort_values('entry_time', ascending=False)
+
+    ticker_df = recent[[
+        'entry_time', 'symbol', 'type', 'entry_price',
+        'exit_price', 'pnl', 'pnl_percent', 'status'
+    ]].copy()
+    ticker_df['status'] = np.where(ticker_df['status'] == 'CLOSED', "✅ CLOSED", "⏳ OPEN")
+
+    # Green highlights winners, red losses, yellow neutral
+    pnl = ticker_df['pnl'].to_numpy()
+    row_styles = np.select([pnl > 0, pnl < 0],
+                           ["background-color: #d4edda", "background-color: #f8d7da"],
+                           "background-color: #fff3cd")
+    pnl_styles = np.select([pnl > 0, pnl < 0], ["color: green", "color: red"], "color: gray")
+
+    styled = (ticker_df.style
+              .format({
+                  'entry_price': "${:.2f}",
+                  'exit_price': "${:.2f}",
+                  'pnl': "${:+.2f}",
+                  'pnl_percent': "{:+.2f}%"
+              }, na_rep="-")
+              .apply(lambda col: row_styles)
+              .apply(lambda col: pnl_styles, subset=['pnl', 'pnl_percent']))
+
+    st.dataframe(styled, use_container_width=True, hide_index=True,
+                 column_config={
+                     'entry_time': st.column_config.DatetimeColumn("TIME", format="HH:mm:ss"),
+                     'symbol': "SYMBOL",
+                     'type': "TYPE",
+                     'entry_price': "ENTRY",
+                     'exit_price': "EXIT",
+                     'pnl': "P&L",
+                     'pnl_percent': "P&L %",
+                     'status': "STATUS"
+                 })
+
+@st.fragment
+def render_trade_history(trades_df):
+    """Filterable trade history table and summary"""
+    # Filters
+    symbol_options = trades_df['symbol'].cat.categories.tolist()
+    status_options = trades_df['status'].cat.categories.tolist()
+    col1, col2, col3 = st.columns(3)
+
+    with col1:
+        symbol_filter = st.multiselect("Filter by Symbol", 
+                                      options=symbol_options,
+                                      default=symbol_options)
+
+    with col2:
+        status_filter = st.multiselect("Filter by Status",
+                                      options=status_options,
+                                      default=status_options)
+
+    with col3:
+        date_filter = st.date_input("From Date", value=trades_df['entry_time'].min())
+
+    # Apply filters
+    filtered_df = trades_df[
+        (trades_df['symbol'].isin(symbol_filter)) &
+        (trades_df['status'].isin(status_filter)) &
+        (trades_df['entry_time'] >= pd.Timestamp(date_filter))
+    ].sort_values('entry_time', ascending=False)
+
+    if not filtered_df.empty:
+        # Display table
+        display_df = filtered_df[[
+            'symbol', 'type', 'entry_price', 'exit_price', 
+            'pnl', 'pnl_percent', 'status', 'entry_time'
+        ]].copy()
+
+        display_df.columns = ['Symbol', 'Type', 'Entry', 'Exit', 'P&L', 'P&L %', 'Status', 'Date']
+
+        # Format numbers client-side, keeping numeric dtypes
+        st.dataframe(display_df, use_container_width=True, hide_index=True, column_config={
+            'Entry': st.column_config.NumberColumn(format="$%.2f"),
+            'Exit': st.column_config.NumberColumn(format="$%.2f"),
+            'P&L': st.column_config.NumberColumn(format="$%.2f"),
+            'P&L %': st.column_config.NumberColumn(format="%.2f%%")
+        })
+
+        # Summary statistics for filtered data
+        st.subheader("Filtered Summary")
+        col1, col2, col3 = st.columns(3)
+
+        with col1:
+            st.metric("Trades", len(filtered_df))
+
+        with col2:
+            total_pnl = filtered_df['pnl'].sum()
+            st.metric("Total P&L", f"${total_pnl:.2f}")
+
+        with col3:
+            win_rate = (filtered_df['pnl'] > 0).sum() / len(filtered_df) * 100
+            st.metric("Win Rate", f"{win_rate:.1f}%")
+    else:
+        st.info("No trades match the selected filters.")
 
 # Dashboard page
 if page == "Dashboard":
     st.header("Performance Summary")
     
     if trades_data:
-        metrics = get_performance_metrics(trades_df)
-        
-        col1, col2, col3, col4 = st.columns(4)
-        
-        with col1:
-            st.metric("Total Trades", int(metrics['total_trades']), 
-                     delta=f"{metrics['win_rate']:.1f}% Win Rate")
-        
-        with col2:
-            color = "🟢" if metrics['winning_trades'] > metrics['losing_trades'] else "🔴"
-            st.metric(f"{color} Winning / Losing", 
-                     f"{int(metrics['winning_trades'])} / {int(metrics['losing_trades'])}")
-        
-        with col3:
-            pnl_color = "green" if metrics['total_pnl'] > 0 else "red"
-            st.metric("Total P&L", f"${metrics['total_pnl']:.2f}", 
-                     delta_color=pnl_color if metrics['total_pnl'] > 0 else "red")
-        
-        with col4:
-            st.metric("Avg P&L per Trade", f"${metrics['avg_pnl']:.2f}")
-        
-        # Recent trades - Live Ticker Style
-        st.subheader("📺 Live Trade Ticker")
-        recent = trades_df.tail(15).sort_values('entry_time', ascending=False)
-        
-        # Create columns for ticker display
-        ticker_cols = st.columns([1, 2, 2, 2, 2])
-        with ticker_cols[0]:
-            st.markdown("**TIME**")
-        with ticker_cols[1]:
-            st.markdown("**SYMBOL / TYPE**")
-        with ticker_cols[2]:
-            st.markdown("**ENTRY → EXIT**")
-        with ticker_cols[3]:
-            st.markdown("**P&L**")
-        with ticker_cols[4]:
-            st.markdown("**STATUS**")
-        
-        st.divider()
-        
-        for _, trade in recent.iterrows():
-            color_class = "win-trade" if trade['pnl'] > 0 else "loss-trade" if trade['pnl'] < 0 else "neutral-trade"
-            pnl_sign = "+" if trade['pnl'] > 0 else ""
-            status_badge = "✅ CLOSED" if trade['status'] == 'CLOSED' else "⏳ OPEN"
-            status_color = "green" if trade['status'] == 'CLOSED' else "blue"
-            pnl_color = "green" if trade['pnl'] > 0 else "red" if trade['pnl'] < 0 else "gray"
-            
-            ticker_cols = st.columns([1, 2, 2, 2, 2])
-            
-            with ticker_cols[0]:
-                st.caption(trade['entry_time'].strftime("%H:%M:%S"))
-            
-            with ticker_cols[1]:
-                st.markdown(f"**{trade['symbol']}** \n{trade['type']}")
-            
-            with ticker_cols[2]:
-                st.caption(f"${trade['entry_price']:.2f} → ${trade['exit_price']:.2f}")
-            
-            with ticker_cols[3]:
-                st.markdown(f"<span style='color:{pnl_color}'><b>{pnl_sign}${trade['pnl']:.2f}</b></span> \n({pnl_sign}{trade['pnl_percent']:.2f}%)", 
-                           unsafe_allow_html=True)
-            
-            with ticker_cols[4]:
-                st.markdown(f"<span style='color:{status_color}'>{status_badge}</span>", 
-                           unsafe_allow_html=True)
+        render_dashboard()
     else:
         st.info("No trades recorded yet. Use 'Add Trade' to record your first trade.")
 
@@ -266,62 +404,7 @@ elif page == "Trade History":
     st.header("Trade History")
     
     if trades_data:
-        # Filters
-        col1, col2, col3 = st.columns(3)
-        
-        with col1:
-            symbol_filter = st.multiselect("Filter by Symbol", 
-                                          options=trades_df['symbol'].unique(),
-                                          default=trades_df['symbol'].unique())
-        
-        with col2:
-            status_filter = st.multiselect("Filter by Status",
-                                          options=trades_df['status'].unique(),
-                                          default=trades_df['status'].unique())
-        
-        with col3:
-            date_filter = st.date_input("From Date", value=trades_df['entry_time'].min())
-        
-        # Apply filters
-        filtered_df = trades_df[
-            (trades_df['symbol'].isin(symbol_filter)) &
-            (trades_df['status'].isin(status_filter)) &
-            (trades_df['entry_time'] >= pd.Timestamp(date_filter))
-        ].sort_values('entry_time', ascending=False)
-        
-        if not filtered_df.empty:
-            # Display table
-            display_df = filtered_df[[
-                'symbol', 'type', 'entry_price', 'exit_price', 
-                'pnl', 'pnl_percent', 'status', 'entry_time'
-            ]].copy()
-            
-            display_df.columns = ['Symbol', 'Type', 'Entry', 'Exit', 'P&L', 'P&L %', 'Status', 'Date']
-            
-            # Format numbers
-            display_df['Entry'] = display_df['Entry'].apply(lambda x: f"${x:.2f}")
-            display_df['Exit'] = display_df['Exit'].apply(lambda x: f"${x:.2f}" if pd.notna(x) else "-")
-            display_df['P&L'] = display_df['P&L'].apply(lambda x: f"${x:.2f}")
-            display_df['P&L %'] = display_df['P&L %'].apply(lambda x: f"{x:.2f}%")
-            
-            st.dataframe(display_df, use_container_width=True, hide_index=True)
-            
-            # Summary statistics for filtered data
-            st.subheader("Filtered Summary")
-            col1, col2, col3 = st.columns(3)
-            
-            with col1:
-                st.metric("Trades", len(filtered_df))
-            
-            with col2:
-                total_pnl = filtered_df['pnl'].sum()
-                st.metric("Total P&L", f"${total_pnl:.2f}")
-            
-            with col3:
-                win_rate = (filtered_df['pnl'] > 0).sum() / len(filtered_df) * 100
-                st.metric("Win Rate", f"{win_rate:.1f}%")
-        else:
-            st.info("No trades match the selected filters.")
+        render_trade_history(trades_df)
     else:
         st.info("No trade history available.")
 
@@ -365,7 +448,7 @@ elif page == "Analytics":
     st.header("Performance Analytics")
     
     if trades_data and not trades_df.empty:
-        metrics = get_performance_metrics(trades_df)
+        metrics = get_performance_metrics(trades_df['pnl'].to_numpy(), trades_df['status'].to_numpy(dtype=str))
         
         # Performance overview
         col1, col2, col3, col4 = st.columns(4)
@@ -397,7 +480,7 @@ elif page == "Analytics":
                     fig.add_trace(go.Bar(
                         y=trades_df['symbol'],
                         x=trades_df['pnl'],
-                        marker_color=['green' if x > 0 else 'red' for x in trades_df['pnl']],
+                        marker_color=np.where(trades_df['pnl'].to_numpy() > 0, 'green', 'red'),
                         orientation='h'
                     ))
                     fig.update_layout(title="P&L by Trade", xaxis_title="P&L ($)", height=400)
@@ -423,13 +506,15 @@ elif page == "Analytics":
         # Cumulative P&L
         try:
             if len(trades_df) > 0:
-                trades_df_sorted = trades_df.sort_values('entry_time')
-                trades_df_sorted['cumulative_pnl'] = trades_df_sorted['pnl'].cumsum()
+                # Naive UTC datetime64 so the cache hashes by value, not object pointers
+                entry_times = pd.to_datetime(trades_df['entry_time'], utc=True).dt.tz_localize(None)
+                entry_times, cum_pnl = cumulative_pnl(entry_times.to_numpy(dtype='datetime64[ns]'),
+                                                      trades_df['pnl'].to_numpy())
                 
                 fig = go.Figure()
                 fig.add_trace(go.Scatter(
-                    x=trades_df_sorted['entry_time'],
-                    y=trades_df_sorted['cumulative_pnl'],
+                    x=entry_times,
+                    y=cum_pnl,
                     mode='lines+markers',
                     name='Cumulative P&L',
                     line=dict(color='blue', width=2),
@@ -448,7 +533,7 @@ elif page == "Analytics":
         # Trades by symbol
         try:
             if len(trades_df) > 0:
-                symbol_summary = trades_df.groupby('symbol').agg({
+                symbol_summary = trades_df.groupby('symbol', observed=True).agg({
                     'pnl': ['sum', 'count', 'mean']
                 }).round(2)
                 symbol_summary.columns = ['Total P&L', 'Trades', 'Avg P&L']
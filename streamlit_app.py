@@ -7,6 +7,11 @@ import pytz
 import plotly.graph_objects as go
 from plotly.subplots import make_subplots
 
+try:
+    from numba import njit
+except ImportError:  # numba is optional; pandas ewm gives identical results
+    njit = None
+
 st.set_page_config(page_title="Spiketrade", layout="wide")
 
 CALIBRATED_WEIGHTS = {
@@ -28,46 +33,131 @@ TRADING_SETTINGS = {
     "stochasticOversoldThreshold": 30, "rvolThreshold": 1.2
 }
 
+def _ema_recursion(values, alpha):
+    # Same as pandas ewm(alpha=alpha, adjust=False): across NaN gaps the old
+    # weight keeps decaying, so the next observation is weighted accordingly
+    out = np.empty_like(values)
+    weighted = values[0]
+    out[0] = weighted
+    old_wt = 1.0
+    for i in range(1, values.shape[0]):
+        cur = values[i]
+        if not np.isnan(weighted):
+            old_wt *= 1 - alpha
+            if not np.isnan(cur):
+                if weighted != cur:
+                    weighted = (old_wt * weighted + alpha * cur) / (old_wt + alpha)
+                old_wt = 1.0
+        elif not np.isnan(cur):
+            weighted = cur
+        out[i] = weighted
+    return out
+
+if njit is not None:
+    _ema_recursion = njit(cache=True)(_ema_recursion)
+
 class PennyBreakoutStrategy:
     def __init__(self):
         self.settings = TRADING_SETTINGS
         self.weights = CALIBRATED_WEIGHTS
     
+    def _smooth(self, values, alpha):
+        if njit is None:
+            return pd.Series(values).ewm(alpha=alpha, adjust=False).mean().to_numpy()
+        return _ema_recursion(values, alpha)
+    
     def calculate_rsi(self, prices, period=14):
-        delta = prices.diff()
-        gain = (delta.where(delta > 0, 0)).rolling(window=period).mean()
-        loss = (-delta.where(delta < 0, 0)).rolling(window=period).mean()
-        rs = gain / loss
-        return 100 - (100 / (1 + rs))
+        values = prices.to_numpy(dtype=np.float64)
+        delta = np.diff(values, prepend=values[0])
+        # Wilder's smoothing of gains and losses
+        avg_gain = self._smooth(np.maximum(delta, 0), 1 / period)
+        avg_loss = self._smooth(np.maximum(-delta, 0), 1 / period)
+        # No losses gives RSI 100; a flat stretch (no gains or losses) gives NaN
+        with np.errstate(divide='ignore', invalid='ignore'):
+            rsi = 100 - 100 / (1 + avg_gain / avg_loss)
+        rsi[:period - 1] = np.nan  # warmup, as with the rolling window
+        return pd.Series(rsi, index=prices.index)
     
     def calculate_ema(self, prices, period):
-        return prices.ewm(span=period, adjust=False).mean()
+        values = prices.to_numpy(dtype=np.float64)
+        return pd.Series(self._smooth(values, 2 / (period + 1)), index=prices.index)
     
     def calculate_macd(self, prices, fast=12, slow=26, signal=9):
-        ema_fast = prices.ewm(span=fast, adjust=False).mean()
-        ema_slow = prices.ewm(span=slow, adjust=False).mean()
+        ema_fast = self.calculate_ema(prices, fast)
+        ema_slow = self.calculate_ema(prices, slow)
         macd_line = ema_fast - ema_slow
-        signal_line = macd_line.ewm(span=signal, adjust=False).mean()
+        signal_line = self.calculate_ema(macd_line, signal)
         return macd_line, signal_line, macd_line - signal_line
     
     def calculate_signals(self, df):
-        df = df.copy()
-        df['RSI'] = self.calculate_rsi(df['Close'], self.settings['rsiLengthMinutes'])
-        df['EMA_9'] = self.calculate_ema(df['Close'], 9)
-        df['EMA_20'] = self.calculate_ema(df['Close'], 20)
-        df['EMA_50'] = self.calculate_ema(df['Close'], 50)
-        df['MACD'], df['MACD_Signal'], df['MACD_Hist'] = self.calculate_macd(df['Close'])
-        return df
-
-def fetch_stock_data(ticker):
-    try:
-        stock = yf.Ticker(ticker)
-        df = stock.history(period="1d", interval="1m", prepost=True)
-        if df.empty:
-            return None, "No data available"
-        return df, None
-    except Exception as e:
-        return None, str(e)
+        close = df['Close']
+        out = {col: df[col].to_numpy() for col in ('Open', 'High', 'Low', 'Close', 'Volume')}
+        out['RSI'] = self.calculate_rsi(close, self.settings['rsiLengthMinutes']).to_numpy()
+        out['EMA_9'] = self.calculate_ema(close, 9).to_numpy()
+        out['EMA_20'] = self.calculate_ema(close, 20).to_numpy()
+        out['EMA_50'] = self.calculate_ema(close, 50).to_numpy()
+        macd_line, signal_line, macd_hist = self.calculate_macd(close)
+        out['MACD'], out['MACD_Signal'], out['MACD_Hist'] = macd_line.to_numpy(), signal_line.to_numpy(), macd_hist.to_numpy()
+        return pd.DataFrame(out, index=df.index)
+
+@st.cache_data(ttl=60, max_entries=128, show_spinner=False)
+def compute_signals(df):
+    return PennyBreakoutStrategy().calculate_signals(df)
+
+@st.cache_resource(max_entries=128, show_spinner=False)
+def _get_ticker(symbol: str):
+    return yf.Ticker(symbol)
+
+@st.cache_data(ttl=60, max_entries=128, show_spinner=False)
+def fetch_stock_data(ticker: str):
+    # Errors are raised rather than returned so only successful fetches are cached
+    df = _get_ticker(ticker).history(period="1d", interval="1m", prepost=True)
+    if df.empty:
+        raise ValueError("No data available")
+    return df
+
+@st.cache_data(ttl=30, max_entries=128, show_spinner=False)
+def build_price_figure(df):
+    fig = make_subplots(rows=2, cols=1, shared_xaxes=True, 
+                       row_heights=[0.7, 0.3],
+                       subplot_titles=("Price Action", "Volume"))
+
+    fig.add_trace(go.Candlestick(
+        x=df.index,
+        open=df['Open'],
+        high=df['High'],
+        low=df['Low'],
+        close=df['Close'],
+        name="Price",
+        increasing_line_color='#00FF00',
+        decreasing_line_color='#FF0000'
+    ), row=1, col=1)
+
+    fig.add_trace(go.Bar(
+        x=df.index,
+        y=df['Volume'],
+        name="Volume",
+        marker_color='rgba(100, 100, 255, 0.5)'
+    ), row=2, col=1)
+
+    # Add EMAs
+    fig.add_trace(go.Scatter(
+        x=df.index,
+        y=df['EMA_9'],
+        name="EMA 9",
+        line=dict(color='#FFA500', width=1)
+    ), row=1, col=1)
+
+    fig.add_trace(go.Scatter(
+        x=df.index,
+        y=df['EMA_20'],
+        name="EMA 20",
+        line=dict(color='#0099FF', width=1)
+    ), row=1, col=1)
+
+    fig.update_layout(height=600, hovermode='x unified', 
+                    template='plotly_dark', showlegend=True)
+    return fig.to_dict()
 
 def get_market_status():
     et_tz = pytz.timezone('US/Eastern')
@@ -141,13 +231,15 @@ if st.session_state.get('selected_ticker'):
     ticker = st.session_state['selected_ticker']
     
     with st.spinner(f"Loading {ticker} data..."):
-        df, error = fetch_stock_data(ticker)
+        try:
+            df, error = fetch_stock_data(ticker), None
+        except Exception as e:
+            df, error = None, str(e)
         
         if error:
             st.error(f"Error: {error}")
         elif df is not None:
-            strategy = PennyBreakoutStrategy()
-            df = strategy.calculate_signals(df)
+            df = compute_signals(df)
             
             latest = df.iloc[-1]
             current_price = float(latest['Close'])
@@ -161,46 +253,7 @@ if st.session_state.get('selected_ticker'):
                 st.metric("MACD", f"{latest['MACD']:.4f}")
             
             # Candlestick chart
-            fig = make_subplots(rows=2, cols=1, shared_xaxes=True, 
-                               row_heights=[0.7, 0.3],
-                               subplot_titles=("Price Action", "Volume"))
-            
-            fig.add_trace(go.Candlestick(
-                x=df.index,
-                open=df['Open'],
-                high=df['High'],
-                low=df['Low'],
-                close=df['Close'],
-                name="Price",
-                increasing_line_color='#00FF00',
-                decreasing_line_color='#FF0000'
-            ), row=1, col=1)
-            
-            fig.add_trace(go.Bar(
-                x=df.index,
-                y=df['Volume'],
-                name="Volume",
-                marker_color='rgba(100, 100, 255, 0.5)'
-            ), row=2, col=1)
-            
-            # Add EMAs
-            fig.add_trace(go.Scatter(
-                x=df.index,
-                y=df['EMA_9'],
-                name="EMA 9",
-                line=dict(color='#FFA500', width=1)
-            ), row=1, col=1)
-            
-            fig.add_trace(go.Scatter(
-                x=df.index,
-                y=df['EMA_20'],
-                name="EMA 20",
-                line=dict(color='#0099FF', width=1)
-            ), row=1, col=1)
-            
-            fig.update_layout(height=600, hovermode='x unified', 
-                            template='plotly_dark', showlegend=True)
-            st.plotly_chart(fig, use_container_width=True)
+            st.plotly_chart(go.Figure(build_price_figure(df)), use_container_width=True)
             
             # Technical indicators
             col_rsi, col_macd, col_ema = st.columns(3)